@@ -5,6 +5,7 @@ from deriva.core import tag
 from .editors import JSONEditor, AnnotationEditor, VisibleSourcesEditor, SourceDefinitionsEditor, CitationEditor, \
     TableDisplayEditor, ForeignKeyAnnotationEditor, DisplayAnnotationEditor, AssetAnnotationEditor, \
     KeyDisplayEditor, ColumnDisplayEditor
+from .editors.common import flush_pending_edits
 
 
 class SchemaEditor(QGroupBox):
@@ -23,6 +24,7 @@ class SchemaEditor(QGroupBox):
 
     @property
     def data(self):
+        self.flush()
         return self.editor.data
 
     @data.setter
@@ -78,3 +80,8 @@ class SchemaEditor(QGroupBox):
 
         # record the editor
         self.editor = widget
+
+    def flush(self):
+        """Commits edits still pending in the editors (e.g., debounced markdown input) to the model.
+        """
+        flush_pending_edits()
@@ -9,6 +9,28 @@ from PyQt5.QtCore import Qt, QObject, pyqtSlot, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
+# hooks of existing editor widgets that commit their pending (e.g., debounced) input, see `flush_pending_edits`
+_flush_hooks = set()
+
+
+def register_flush_hook(widget: QObject, hook: Callable):
+    """Registers a hook that commits input still pending in the widget to its annotation body.
+
+    The hook is unregistered when the widget is destroyed.
+
+    :param widget: the editor widget that holds the pending input
+    :param hook: function that commits the pending input, if any
+    """
+    _flush_hooks.add(hook)
+    widget.destroyed.connect(lambda: _flush_hooks.discard(hook))
+
+
+def flush_pending_edits():
+    """Commits input still pending in any editor widget, before the annotations are read.
+    """
+    for hook in list(_flush_hooks):
+        hook()
+
 
 def raise_on_invalid(model_obj, valid, tag: str):
     """Raises type error for tags applied to invalid model object types.
@@ -38,8 +60,22 @@ def set_value_or_del_key(container: dict, cond: bool, key: str, value):
     # set or delete value
     if cond:
         container[key] = value
-    elif key in container:
-        del container[key]
+    else:
+        container.pop(key, None)
+
+
+def copy_json(value):
+    """Returns a deep copy of a JSON-structured value, such as an annotation property.
+
+    JSON values are acyclic trees of dicts and lists with immutable leaves, so unlike `copy.deepcopy` this needs no
+    memo and returns the leaves as-is.
+    """
+    t = type(value)
+    if t is dict:
+        return {k: copy_json(v) for k, v in value.items()}
+    if t is list:
+        return [copy_json(v) for v in value]
+    return value
 
 
 def constraint_name(constraint):
@@ -97,13 +133,13 @@ class SubsetSelectionWidget(QListWidget):
         self.selected_values = selected_values
         to_string = to_string or (lambda v: str(v))
 
-        self.setSortingEnabled(True)
         for value in all_values:
             item = QListWidgetItem(to_string(value))
             item.setData(Qt.UserRole, value)
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
             item.setCheckState(Qt.Checked if value in selected_values else Qt.Unchecked)
             self.addItem(item)
+        self.setSortingEnabled(True)  # enabled after populating, to sort once rather than on every insert
         self.itemClicked.connect(self._on_item_clicked)
 
     @pyqtSlot()
@@ -195,14 +231,20 @@ class SimpleTextPropertyWidget(QLineEdit):
             placeholder: str = '',
             validator: QValidator = None,
             truth_fn: Callable = bool,
+            commit_on: str = 'change',
             parent: QWidget = None):
         """Initialize the widget.
 
+        By default, the value is committed to the body on every text change. On very large forms, where listeners of
+        `valueChanged` do expensive work, use `commit_on='finish'` to defer the commit until editing is finished (i.e.,
+        return pressed or focus lost).
+
         :param key: annotation key
         :param body: annotation body (container)
         :param placeholder: text to display when no value set in the widget
         :param validator: optional validator for the line editor
         :param truth_fn: function applied to value to determine whether it should be set or dropped from body
+        :param commit_on: when to commit the value, either 'change' or 'finish'
         :param parent: parent widget
         """
         super(SimpleTextPropertyWidget, self).__init__(parent=parent)
@@ -212,21 +254,25 @@ class SimpleTextPropertyWidget(QLineEdit):
         if isinstance(self.value, str):
             self.setText(self.value)
         self.setPlaceholderText(placeholder)
-        self.textChanged.connect(self._on_textChanged)
+        if commit_on == 'change':
+            self.textChanged.connect(self._on_textChanged)
+        elif commit_on == 'finish':
+            self.editingFinished.connect(self._on_textChanged)
+        else:
+            raise ValueError('Invalid commit_on mode "%s"' % commit_on)
         if validator:
             self.setValidator(validator)
 
     @pyqtSlot()
     def _on_textChanged(self):
-        """Handles textChanged events.
+        """Handles textChanged (or editingFinished) events.
         """
-        self.value = self.text()
-        set_value_or_del_key(
-            self.body,
-            self._truth_fn(self.value),
-            self.key,
-            self.value
-        )
+        # ...inlined `set_value_or_del_key`, since this runs on every keystroke
+        self.value = value = self.text()
+        if self._truth_fn(value):
+            self.body[self.key] = value
+        else:
+            self.body.pop(self.key, None)
         self.valueChanged.emit()
 
 
@@ -302,11 +348,14 @@ class SimpleComboBoxPropertyWidget(QComboBox):
         self.key, self.body = key, body
         self._truth_fn = truth_fn
         self.value = self.body.get(self.key, '')
+        choices = list(choices)
         self.addItem('')
         self.addItems(choices)
         self.setPlaceholderText(placeholder)
         if isinstance(self.value, str):  # ignore non-str values
-            self.setCurrentIndex(self.findText(self.value) or -1)
+            # ...choices follow the blank item; the blank value itself is left unselected to show the placeholder
+            choice_index = {choice: i for i, choice in enumerate(choices, start=1)}
+            self.setCurrentIndex(choice_index.get(self.value, -1))
         self.currentIndexChanged.connect(self._on_index_changed)
 
     @pyqtSlot()
@@ -329,7 +378,7 @@ class CommentDisplayWidget(SimpleComboBoxPropertyWidget):
             self,
             body: dict,
             key: str = 'comment_display',
-            choices: iter = frozenset(['inline', 'tooltip']),
+            choices: iter = ('inline', 'tooltip'),
             placeholder: str = 'Select a comment display mode',
             truth_fn: Callable = bool,
             parent: QWidget = None
@@ -391,7 +440,6 @@ class MultipleChoicePropertyWidget(QWidget):
 
         # button group
         self.buttonGroup = QButtonGroup(self)
-        self.buttonGroup.buttonClicked.connect(self._on_buttonGroup_clicked)
 
         # choices
         for k, v in choices.items():
@@ -415,21 +463,27 @@ class MultipleChoicePropertyWidget(QWidget):
             else:
                 other_widget.setEnabled(False)
 
-    @pyqtSlot()
-    def _on_other_widget_valueChanged(self):
-        """Handle changes from other_widget.
+        # ...connect only after the initial state is set, consistent with the other property widgets
+        self.buttonGroup.buttonClicked.connect(self._on_buttonGroup_clicked)
+
+    def _commit(self, value):
+        """Sets the value, then sets or deletes it in the annotation and emits the change.
         """
-        self.value = self.other_widget.value
-        # ...set value in annotation
+        self.value = value
         set_value_or_del_key(
             self.body,
             self._truth_fn(self.value),
             self.key,
             self.value
         )
-        # ...emit signal
         self.valueChanged.emit()
 
+    @pyqtSlot()
+    def _on_other_widget_valueChanged(self):
+        """Handle changes from other_widget.
+        """
+        self._commit(self.other_widget.value)
+
     @pyqtSlot()
     def _on_buttonGroup_clicked(self):
         """Handles buttonGroup click even.
@@ -438,21 +492,13 @@ class MultipleChoicePropertyWidget(QWidget):
         choice_key = self.buttonGroup.checkedButton().text()
         # ...get value from control state
         if choice_key == self.other_key:
-            self.value = self.other_widget.value
+            value = self.other_widget.value
             self.other_widget.setEnabled(True)
         else:
-            self.value = self.choices[choice_key]
+            value = self.choices[choice_key]
             if self.other_widget:
                 self.other_widget.setEnabled(False)
-        # ...set value in annotation
-        set_value_or_del_key(
-            self.body,
-            self._truth_fn(self.value),
-            self.key,
-            self.value
-        )
-        # ...emit signal
-        self.valueChanged.emit()
+        self._commit(value)
 
 
 class SimpleNestedPropertyManager(QObject):
@@ -507,10 +553,10 @@ class SimpleNestedPropertyManager(QObject):
     def onValueChanged(self):
         """Listens for changes and sets or removes nested property if it satisfies truth function.
         """
-        set_value_or_del_key(
-            self.body,
-            self._truth_fn(self.value),
-            self.key,
-            self.value
-        )
+        # the nested container is held by the manager, so it only needs to be (re)attached when it is missing
+        if self._truth_fn(self.value):
+            if self.body.get(self.key) is not self.value:
+                self.body[self.key] = self.value
+        else:
+            self.body.pop(self.key, None)
         self.valueChanged.emit()
@@ -45,6 +45,7 @@ class AnnotationEditor(JSONEditor):
         self._parent = None
         self._tag = None
         self._body = None
+        self._loading = False  # set while the text is loaded from the body, to skip parsing it right back
         if data:
             self.data = data
 
@@ -70,12 +71,19 @@ class AnnotationEditor(JSONEditor):
         else:
             self._body = self._parent.annotations
 
-        self.setPlainText(
-            json.dumps(self._body, indent=2)
-        )
+        # ...only skip this editor's own commit, since the code editor relies on its other signals (e.g., line numbers)
+        self._loading = True
+        try:
+            self.setPlainText(
+                json.dumps(self._body, indent=2)
+            )
+        finally:
+            self._loading = False
 
     @pyqtSlot()
     def on_textChanged(self):
+        if self._loading:
+            return
         try:
             self._body = json.loads(self.toPlainText())
             if self._tag:
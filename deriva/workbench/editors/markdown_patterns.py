@@ -1,9 +1,10 @@
 """Widgets for markdown pattern and related properties.
 """
 from typing import Callable
-from PyQt5.QtWidgets import QWidget, QFormLayout, QTextEdit, QVBoxLayout
-from PyQt5.QtCore import pyqtSlot, pyqtSignal
-from .common import set_value_or_del_key, SubsetSelectionWidget, SimpleComboBoxPropertyWidget
+from PyQt5.QtGui import QShowEvent, QHideEvent
+from PyQt5.QtWidgets import QWidget, QFormLayout, QPlainTextEdit, QVBoxLayout
+from PyQt5.QtCore import QEvent, QObject, QTimer, pyqtSlot, pyqtSignal
+from .common import set_value_or_del_key, register_flush_hook, SubsetSelectionWidget, SimpleComboBoxPropertyWidget
 
 
 class MarkdownPatternForm(QWidget):
@@ -12,6 +13,9 @@ class MarkdownPatternForm(QWidget):
 
     valueChanged = pyqtSignal()
 
+    # delay (ms) used to coalesce keystrokes in the markdown fields into a single commit
+    commit_delay = 200
+
     def __init__(
             self, field_keys: [(str, str)],
             body: dict,
@@ -36,12 +40,20 @@ class MarkdownPatternForm(QWidget):
         self.setLayout(self.form)
         self.setAutoFillBackground(True)
 
+        # debounce timer for the markdown fields
+        self._commitTimer = QTimer(self)
+        self._commitTimer.setSingleShot(True)
+        self._commitTimer.setInterval(self.commit_delay)
+        self._commitTimer.timeout.connect(self._on_markdown_pattern_changed)
+        register_flush_hook(self, self.flush)  # lets readers of the annotations commit pending input first
+
         # add pattern fields
         self._markdown_pattern_fields = {}
         for key, label in self._field_keys:
-            mdField = QTextEdit(self._body.get(key, ''), parent=self)
+            mdField = QPlainTextEdit(self._body.get(key, ''), parent=self)
             mdField.setPlaceholderText('Enter markdown pattern')
-            mdField.textChanged.connect(self._on_value_changed)
+            mdField.textChanged.connect(self._commitTimer.start)
+            mdField.installEventFilter(self)  # commit pending changes on focus out
             self._markdown_pattern_fields[key] = mdField
             self.form.addRow(label, mdField)
 
@@ -62,20 +74,52 @@ class MarkdownPatternForm(QWidget):
     def value(self) -> dict:
         """Returns the body since it contains the set of properties managed by this widget.
         """
+        self.flush()
         return self._body
 
+    def flush(self):
+        """Commits any pending (debounced) changes of the markdown fields to the body.
+        """
+        if self._commitTimer.isActive():
+            self._on_markdown_pattern_changed()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Commits any pending (debounced) changes when a markdown field loses focus.
+        """
+        if event.type() == QEvent.FocusOut:
+            self.flush()
+        return super(MarkdownPatternForm, self).eventFilter(watched, event)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Commits any pending (debounced) changes when hidden, e.g., when the owning dialog is accepted.
+        """
+        self.flush()
+        super(MarkdownPatternForm, self).hideEvent(event)
+
     @pyqtSlot()
     def _on_value_changed(self):
-        """Handles changes to the markdown fields.
+        """Handles changes to the other fields of the form.
         """
+        self.valueChanged.emit()
+
+    @pyqtSlot()
+    def _on_markdown_pattern_changed(self):
+        """Handles (debounced) changes to the markdown fields.
+        """
+        self._commitTimer.stop()
+        changed = False
         for key, _ in self._field_keys:
             text = self._markdown_pattern_fields[key].toPlainText()
+            if text == self._body.get(key, ''):
+                continue  # e.g., the text was edited but ended up unchanged
             set_value_or_del_key(
                 self._body,
                 bool(text),
                 key,
                 text
             )
+            changed = True
+        if changed:
             self.valueChanged.emit()
 
 
@@ -113,14 +157,22 @@ class WaitForWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
-        # ...wait_for
-        waitFor = SubsetSelectionWidget(
-            self.value,
-            sourcekeys,
-            parent=self
-        )
-        waitFor.valueChanged.connect(self._on_waitFor_valueChanged)
-        layout.addWidget(waitFor)
+        # ...wait_for selection widget is built on first show
+        self._sourcekeys = sourcekeys
+        self._waitFor = None
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Builds the subset selection widget the first time this widget is shown.
+        """
+        if self._waitFor is None:
+            self._waitFor = SubsetSelectionWidget(
+                self.value,
+                self._sourcekeys,
+                parent=self
+            )
+            self._waitFor.valueChanged.connect(self._on_waitFor_valueChanged)
+            self.layout().addWidget(self._waitFor)
+        super(WaitForWidget, self).showEvent(event)
 
     @pyqtSlot()
     def _on_waitFor_valueChanged(self):
@@ -143,7 +195,7 @@ class TemplateEngineWidget(SimpleComboBoxPropertyWidget):
             self,
             body: dict,
             key: str = 'template_engine',
-            choices: iter = frozenset(['handlebars', 'mustache']),
+            choices: iter = ('handlebars', 'mustache'),
             placeholder: str = 'Select a template engine',
             truth_fn: Callable = bool,
             parent: QWidget = None
@@ -2,13 +2,14 @@
 """
 import logging
 import sys
-from PyQt5.QtCore import pyqtSlot, pyqtSignal
-from PyQt5.QtGui import QIntValidator
-from PyQt5.QtWidgets import QWidget, QFormLayout, QComboBox, QVBoxLayout, QListWidget, QHBoxLayout, QPushButton, \
+from PyQt5.QtCore import Qt, QEvent, QStringListModel, pyqtSlot, pyqtSignal
+from PyQt5.QtGui import QIntValidator, QShowEvent, QStandardItemModel, QStandardItem
+from PyQt5.QtWidgets import QWidget, QFormLayout, QComboBox, QVBoxLayout, QListView, QHBoxLayout, QPushButton, \
     QTabWidget, QFrame, QLabel
 from deriva.core import ermrest_model as _erm, tag as _tag
-from .common import source_component_to_str, constraint_name, SimpleTextPropertyWidget, SimpleComboBoxPropertyWidget, \
-    MultipleChoicePropertyWidget, SimpleBooleanPropertyWidget, CommentDisplayWidget, SimpleNestedPropertyManager
+from .common import constraint_name, source_component_to_str, SimpleTextPropertyWidget, \
+    SimpleComboBoxPropertyWidget, MultipleChoicePropertyWidget, SimpleBooleanPropertyWidget, CommentDisplayWidget, \
+    SimpleNestedPropertyManager
 from .markdown_patterns import MarkdownPatternForm
 from .sortkeys import SortKeysWidget
 from .table import CommonTableWidget
@@ -20,6 +21,7 @@ __sourcekey__ = 'sourcekey'
 __source__ = 'source'
 __outbound__ = 'outbound'
 __inbound__ = 'inbound'
+__column__ = 'column'  # kind of source component, not a property key
 
 
 class PseudoColumnEditWidget(QTabWidget):
@@ -41,16 +43,16 @@ class PseudoColumnEditWidget(QTabWidget):
         :param parent: the QWidget parent of this widget
         """
         super(PseudoColumnEditWidget, self).__init__(parent=parent)
-        self.table, self.entry = table, entry
 
         # ...initialize entry if not starting from an existing pseudo-column
-        if self.entry is None or not isinstance(self.entry, dict):
-            self.entry = {
-                'source': []
-            }
-        elif 'source' not in self.entry:
-            # ...add blank source, if none found... will clean this up later, if not used
-            self.entry['source'] = []
+        if not isinstance(entry, dict):
+            entry = {}
+        # ...add blank source, if none found... will clean this up later, if not used
+        entry.setdefault(__source__, [])
+
+        self.table, self.entry = table, entry
+        self._lazy_tabs = {}  # tab index -> function that builds the tab contents on first activation
+        self.setUpdatesEnabled(False)  # suspend repaints while the tabs and their forms are populated
 
         #
         # -- Source attributes --
@@ -61,12 +63,12 @@ class PseudoColumnEditWidget(QTabWidget):
         self.addTab(sourceTab, 'Source')
 
         # ...sourcekey
-        sourcekeys = self.table.annotations.get(_tag.source_definitions, {}).get('sources', {}).keys()
+        sourcekeys = tuple(self.table.annotations.get(_tag.source_definitions, {}).get('sources', {}).keys())
         if bool(mode & PseudoColumnEditWidget.PseudoColumn):
-            enable_source_entry = __sourcekey__ not in self.entry  # enable if no sourcekey property exists
+            enable_source_entry = __sourcekey__ not in entry  # enable if no sourcekey property exists
             sourceKeyComboBox = SimpleComboBoxPropertyWidget(
                 __sourcekey__,
-                self.entry,
+                entry,
                 sourcekeys,
                 placeholder='Select a source key',
                 parent=self
@@ -77,7 +79,7 @@ class PseudoColumnEditWidget(QTabWidget):
             enable_source_entry = True
             form.addRow('Source Key', SimpleTextPropertyWidget(
                 __sourcekey__,
-                self.entry,
+                entry,
                 placeholder='Enter source key',
                 parent=self
             ))
@@ -85,137 +87,26 @@ class PseudoColumnEditWidget(QTabWidget):
             raise ValueError('Invalid mode selected for source key control initialization')
 
         # ...source
-        self.sourceEntry = _SourceEntryWidget(self.table, self.entry, self)
+        self.sourceEntry = _SourceEntryWidget(self.table, entry, self)
         self.sourceEntry.setEnabled(enable_source_entry)
         form.addRow('Source Entry', self.sourceEntry)
 
         #
         # -- Options --
         #
+        # ...the options tab is built on first activation, like the display tab
         optionsTab = QWidget(parent=self)
-        form = QFormLayout(optionsTab)
-        optionsTab.setLayout(form)
-        self.addTab(optionsTab, 'Options')
-
-        # ...markdown name
-        form.addRow('Markdown Name', SimpleTextPropertyWidget(
-            'markdown_name',
-            self.entry,
-            placeholder='Enter markdown pattern',
-            parent=self
-        ))
-
-        # ...comment
-        form.addRow('Comment', SimpleTextPropertyWidget(
-            'comment',
-            self.entry,
-            placeholder='Enter plain text',
-            parent=self
-        ))
-
-        # ...comment_display
-        form.addRow('Comment Display', CommentDisplayWidget(self.entry, parent=self))
-
-        # ...entity
-        entityWidget = MultipleChoicePropertyWidget(
-            'entity',
-            self.entry,
-            {
-                'Treat as an entity': True,
-                'Treat as a scalar value': False,
-                'Default behavior': None
-            },
-            parent=self
-        )
-        entityWidget.layout().setContentsMargins(0, 0, 0, 0)
-        form.addRow('Entity', entityWidget)
-
-        # ...self_link
-        form.addRow('Self Link', SimpleBooleanPropertyWidget(
-            'If source is key, switch display mode to self link',
-            'self_link',
-            self.entry,
-            truth_fn=lambda x: x is not None,
-            parent=self
-        ))
-
-        # ...aggregate
-        form.addRow('Aggregate', SimpleComboBoxPropertyWidget(
-            'aggregate',
-            self.entry,
-            ['min', 'max', 'cnt', 'cnt_d', 'array', 'array_d'],
-            placeholder='Select aggregate function, if desired',
-            parent=self
-        ))
-
-        # array_options
-        array_options = SimpleNestedPropertyManager('array_options', self.entry, parent=self)
-        arrayOptions = QFrame(parent=self)
-        arrayOptions.setFrameStyle(QFrame.StyledPanel | QFrame.Plain)
-        form.addRow('Array Options', arrayOptions)
-        form = QFormLayout(arrayOptions)  # replace tab form with frame's internal form layout
-        arrayOptions.setLayout(form)
-
-        # ...array_options.order
-        arrOrder = SortKeysWidget(
-            'order',
-            array_options.value,
-            [c.name for c in table.columns],
-            parent=arrayOptions
-        )
-        arrOrder.valueChanged.connect(array_options.onValueChanged)
-        form.addRow('Order', arrOrder)
-
-        # ...array_options.max_length
-        arrMaxLen = SimpleTextPropertyWidget(
-            'max_length',
-            array_options.value,
-            placeholder='Maximum number of elements that should be displayed',
-            validator=QIntValidator(1, 2**sys.int_info.bits_per_digit),
-            parent=self
-        )
-        arrMaxLen.valueChanged.connect(array_options.onValueChanged)
-        form.addRow('Max Length', arrMaxLen)
+        optionsTab.setLayout(QFormLayout(optionsTab))
+        self._lazy_tabs[self.addTab(optionsTab, 'Options')] = lambda: self._buildOptionsTab(optionsTab)
 
         #
         # -- Display attributes --
         #
-        display = SimpleNestedPropertyManager('display', self.entry, parent=self)
-        # ...markdown pattern form widget used as the base widget for this tab
-        markdownPattern = MarkdownPatternForm(
-            [('markdown_pattern', 'Markdown Pattern')],
-            display.value,
-            include_template_engine=True,
-            include_wait_for=True,
-            sourcekeys=sourcekeys,
-            parent=self
-        )
-        markdownPattern.valueChanged.connect(display.onValueChanged)
-        self.addTab(markdownPattern, 'Display')
-        form = markdownPattern.form  # extend the markdown pattern form widget
-
-        # ...show_foreign_key_link checkbox
-        fkeyLink = MultipleChoicePropertyWidget(
-            'show_foreign_key_link',
-            display.value,
-            {
-                'Inherited behavior of outbound foreign key display': None,
-                'Avoid adding extra link to the foreign key display': False
-            },
-            parent=self
-        )
-        fkeyLink.valueChanged.connect(display.onValueChanged)
-        form.addRow('Show FK Link', fkeyLink)
-
-        # ...array_ux_mode combobox
-        arrayUXMode = SimpleComboBoxPropertyWidget(
-            'array_ux_mode',
-            display.value,
-            ['olist', 'ulist', 'csv', 'raw'],
-            placeholder='Select a UX mode for aggregate results',
-            parent=self
-        )
-        form.addRow('Array UX Mode', arrayUXMode)
+        # ...the display tab is built on first activation, since most edits never visit it
+        displayTab = QWidget(parent=self)
+        displayTab.setLayout(QVBoxLayout(displayTab))
+        displayTab.layout().setContentsMargins(0, 0, 0, 0)
+        self._lazy_tabs[self.addTab(displayTab, 'Display')] = lambda: self._buildDisplayTab(displayTab, sourcekeys)
 
         #
         # -- Facet --
@@ -231,7 +122,7 @@ class PseudoColumnEditWidget(QTabWidget):
         # ...open
         form.addRow("Open", MultipleChoicePropertyWidget(
             'open',
-            self.entry,
+            entry,
             {
                 "Open the facet by default": True,
                 "Close the facet by default": False,
@@ -243,7 +134,7 @@ class PseudoColumnEditWidget(QTabWidget):
         # ...ux_mode
         form.addRow('UX Mode', SimpleComboBoxPropertyWidget(
             'ux_mode',
-            self.entry,
+            entry,
             choices=['choices', 'ranges', 'check_presence'],
             placeholder='Select the default UX mode for multi-modal facets',
             parent=facetTab
@@ -257,7 +148,7 @@ class PseudoColumnEditWidget(QTabWidget):
         constraintsTab.addTab(
             CommonTableWidget(
                 'choices',
-                self.entry,
+                entry,
                 editor_widget=SimpleTextPropertyWidget(
                     '_',  # this is just a bogus property name
                     {'_': ''},  # bogus property, widget will still produce valid `.value`
@@ -274,7 +165,7 @@ class PseudoColumnEditWidget(QTabWidget):
         constraintsTab.addTab(
             CommonTableWidget(
                 'ranges',
-                self.entry,
+                entry,
                 editor_widget=_RangeWidget(facetTab),
                 headers_fn=lambda ranges: ['Min', 'Min Exclusive', 'Max', 'Max Exclusive'],
                 row_fn=lambda range: (
@@ -290,7 +181,7 @@ class PseudoColumnEditWidget(QTabWidget):
             SimpleBooleanPropertyWidget(
                 'Match any record that has a value other than NULL',
                 'not_null',
-                self.entry,
+                entry,
                 parent=constraintsTab
             ),
             'Not NULL'
@@ -301,14 +192,14 @@ class PseudoColumnEditWidget(QTabWidget):
             'Bar Plot',
             MultipleChoicePropertyWidget(
                 'bar_plot',
-                self.entry,
+                entry,
                 {
                     'Default behavior': None,
                     'Show': True,
                     'Hide': False
                 },
                 other_key='Show w/ # Bins',
-                other_widget=_NBinsWidget(self.entry, parent=self),
+                other_widget=_NBinsWidget(entry, parent=self),
                 parent=self
             )
         )
@@ -319,7 +210,7 @@ class PseudoColumnEditWidget(QTabWidget):
             SimpleBooleanPropertyWidget(
                 'Hide the NULL option in the choice picker',
                 'hide_null_choice',
-                self.entry,
+                entry,
                 parent=self
             )
         )
@@ -330,11 +221,154 @@ class PseudoColumnEditWidget(QTabWidget):
             SimpleBooleanPropertyWidget(
                 'Hide the NOT NULL option in the choice picker',
                 'hide_not_null_choice',
-                self.entry,
+                entry,
                 parent=self
             )
         )
 
+        self.currentChanged.connect(self._on_currentChanged)
+        self.setUpdatesEnabled(True)
+
+    def _buildOptionsTab(self, optionsTab: QWidget):
+        """Builds the contents of the options tab.
+
+        :param optionsTab: the (initially empty) tab widget
+        """
+        table, entry = self.table, self.entry
+        form = optionsTab.layout()
+
+        # ...markdown name
+        form.addRow('Markdown Name', SimpleTextPropertyWidget(
+            'markdown_name',
+            entry,
+            placeholder='Enter markdown pattern',
+            parent=self
+        ))
+
+        # ...comment
+        form.addRow('Comment', SimpleTextPropertyWidget(
+            'comment',
+            entry,
+            placeholder='Enter plain text',
+            parent=self
+        ))
+
+        # ...comment_display
+        form.addRow('Comment Display', CommentDisplayWidget(entry, parent=self))
+
+        # ...entity
+        entityWidget = MultipleChoicePropertyWidget(
+            'entity',
+            entry,
+            {
+                'Treat as an entity': True,
+                'Treat as a scalar value': False,
+                'Default behavior': None
+            },
+            parent=self
+        )
+        entityWidget.layout().setContentsMargins(0, 0, 0, 0)
+        form.addRow('Entity', entityWidget)
+
+        # ...self_link
+        form.addRow('Self Link', SimpleBooleanPropertyWidget(
+            'If source is key, switch display mode to self link',
+            'self_link',
+            entry,
+            truth_fn=lambda x: x is not None,
+            parent=self
+        ))
+
+        # ...aggregate
+        form.addRow('Aggregate', SimpleComboBoxPropertyWidget(
+            'aggregate',
+            entry,
+            ['min', 'max', 'cnt', 'cnt_d', 'array', 'array_d'],
+            placeholder='Select aggregate function, if desired',
+            parent=self
+        ))
+
+        # array_options
+        array_options = SimpleNestedPropertyManager('array_options', entry, parent=self)
+        arrayOptions = QFrame(parent=self)
+        arrayOptions.setFrameStyle(QFrame.StyledPanel | QFrame.Plain)
+        form.addRow('Array Options', arrayOptions)
+        form = QFormLayout(arrayOptions)  # replace tab form with frame's internal form layout
+        arrayOptions.setLayout(form)
+
+        # ...array_options.order
+        arrOrder = SortKeysWidget(
+            'order',
+            array_options.value,
+            [c.name for c in table.columns],
+            parent=arrayOptions
+        )
+        arrOrder.valueChanged.connect(array_options.onValueChanged)
+        form.addRow('Order', arrOrder)
+
+        # ...array_options.max_length
+        arrMaxLen = SimpleTextPropertyWidget(
+            'max_length',
+            array_options.value,
+            placeholder='Maximum number of elements that should be displayed',
+            validator=QIntValidator(1, 2**sys.int_info.bits_per_digit),
+            parent=self
+        )
+        arrMaxLen.valueChanged.connect(array_options.onValueChanged)
+        form.addRow('Max Length', arrMaxLen)
+
+    def _buildDisplayTab(self, displayTab: QWidget, sourcekeys: tuple):
+        """Builds the contents of the display attributes tab.
+
+        :param displayTab: the (initially empty) tab widget
+        :param sourcekeys: source keys that may be selected for the 'wait_for' property
+        """
+        display = SimpleNestedPropertyManager('display', self.entry, parent=self)
+        # ...markdown pattern form widget used as the base widget for this tab
+        markdownPattern = MarkdownPatternForm(
+            [('markdown_pattern', 'Markdown Pattern')],
+            display.value,
+            include_template_engine=True,
+            include_wait_for=True,
+            sourcekeys=sourcekeys,
+            parent=displayTab
+        )
+        markdownPattern.valueChanged.connect(display.onValueChanged)
+        displayTab.layout().addWidget(markdownPattern)
+        form = markdownPattern.form  # extend the markdown pattern form widget
+
+        # ...show_foreign_key_link checkbox
+        fkeyLink = MultipleChoicePropertyWidget(
+            'show_foreign_key_link',
+            display.value,
+            {
+                'Inherited behavior of outbound foreign key display': None,
+                'Avoid adding extra link to the foreign key display': False
+            },
+            parent=displayTab
+        )
+        fkeyLink.valueChanged.connect(display.onValueChanged)
+        form.addRow('Show FK Link', fkeyLink)
+
+        # ...array_ux_mode combobox
+        arrayUXMode = SimpleComboBoxPropertyWidget(
+            'array_ux_mode',
+            display.value,
+            ['olist', 'ulist', 'csv', 'raw'],
+            placeholder='Select a UX mode for aggregate results',
+            parent=displayTab
+        )
+        arrayUXMode.valueChanged.connect(display.onValueChanged)
+        form.addRow('Array UX Mode', arrayUXMode)
+
+    @pyqtSlot(int)
+    def _on_currentChanged(self, index: int):
+        """Handles tab changes by building the contents of lazily constructed tabs.
+        """
+        build = self._lazy_tabs.pop(index, None)
+        if build:
+            build()
+
     @pyqtSlot()
     def on_sourcekey_valueChanged(self):
         """Handles changes to the `sourcekey` combobox.
@@ -362,14 +396,19 @@ class _SourceEntryWidget(QWidget):
         self.table = table
         self.entry = entry
         self.context = [table]
+        self._modelStack = []  # available sources models saved by `on_push`, restored by `on_pop`
+        self._columnIndexes = {}  # table -> its column name-to-column mapping, kept for the lifetime of this widget
 
         # layout
         vlayout = QVBoxLayout(self)
         vlayout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(vlayout)
 
-        # source list widget
-        self.sourceList = QListWidget(parent=self)
+        # source list view (a read-only display of the path elements)
+        self._sourceModel = QStringListModel(self)
+        self.sourceList = QListView(parent=self)
+        self.sourceList.setEditTriggers(QListView.NoEditTriggers)
+        self.sourceList.setModel(self._sourceModel)
         vlayout.addWidget(self.sourceList)
 
         # get source entry and enforce a canonical structure as a list of elements
@@ -379,37 +418,42 @@ class _SourceEntryWidget(QWidget):
         elif isinstance(source, list) and len(source) == 2 and all(isinstance(item, str) for item in source):
             self.entry[__source__] = source = [{__outbound__: source}]
 
-        # populate source list widget and update context
-        validated_path = []
+        # resolvers of the next context, keyed by the kind of source component
+        model = self.table.schema.model
+        resolvers = {
+            __column__: lambda name: self._columnsByName(self.context[-1])[name],
+            __outbound__: lambda name: model.fkey(name).pk_table,
+            __inbound__: lambda name: model.fkey(name).table
+        }
+
+        # validate source path and update context
+        validated_path, validated_labels = [], []
         try:
             for item in source:
-                # update the context, based on the type of source component
+                # update the context, based on the kind of source component
                 if isinstance(item, str):
-                    # case: column name
-                    column = {col.name: col for col in self.context[-1].columns}[item]
-                    self.context.append(column)
+                    kind, name = __column__, item
                 elif __outbound__ in item:
-                    # case: outbound fkey
-                    fkey = self.table.schema.model.fkey(item[__outbound__])
-                    self.context.append(fkey.pk_table)
+                    kind, name = __outbound__, item[__outbound__]
                 else:
-                    # case: inbound fkey
                     assert __inbound__ in item
-                    fkey = self.table.schema.model.fkey(item[__inbound__])
-                    self.context.append(fkey.table)
-                # update the source list
-                self.sourceList.addItem(source_component_to_str(item))
+                    kind, name = __inbound__, item[__inbound__]
+                self.context.append(resolvers[kind](name))
                 validated_path.append(item)
+                validated_labels.append(source_component_to_str(item))
         except KeyError as e:
             logger.error("Invalid path component %s found in source entry %s" % (str(e), str(source)))
             self.entry[__source__] = validated_path  # set source to the valid partial path
 
-        # available sources combobox
+        # populate source list in one batch
+        self._sourceModel.setStringList(validated_labels)
+        self._depth = len(validated_path)  # number of elements in the source path
+
+        # available sources combobox (populated when the widget is first shown while enabled)
         self.availableSource = QComboBox(parent=self)
         self.availableSource.setPlaceholderText('Select next path element for the source entry')
-        context = self.context[-1]
-        if isinstance(context, _erm.Table):
-            self._updateAvailableSourcesFromTable(context)
+        self._availableSourcesPending = True
+        self._availableSources = {}  # table -> its (text, data) pairs, kept only for the lifetime of this widget
         vlayout.addWidget(self.availableSource)
 
         # source push and pop buttons
@@ -418,11 +462,12 @@ class _SourceEntryWidget(QWidget):
         controls.layout().setContentsMargins(0, 0, 0, 5)
         # ...push button
         self.pushButton = QPushButton('push')
-        self.pushButton.setEnabled(len(self.availableSource) > 0)  # disable if no sources
+        self.pushButton.setEnabled(False)  # disabled until available sources are populated
         self.pushButton.clicked.connect(self.on_push)
         controls.layout().addWidget(self.pushButton)
         # ...pop button
         self.popButton = QPushButton('pop')
+        self.popButton.setEnabled(self._depth > 0)  # disable if no path elements
         self.popButton.clicked.connect(self.on_pop)
         controls.layout().addWidget(self.popButton)
         # ...add remaining controls to form
@@ -434,66 +479,122 @@ class _SourceEntryWidget(QWidget):
         """
         return self.entry[__source__]
 
-    def _updateAvailableSourcesFromTable(self, table):
-        """Updates the list of available sources based on the given table."""
+    def _columnsByName(self, table: _erm.Table) -> dict:
+        """Returns the column name-to-column mapping of the table, built once per table for this widget.
+        """
+        columns = self._columnIndexes.get(table)
+        if columns is None:
+            columns = self._columnIndexes[table] = {col.name: col for col in table.columns}
+        return columns
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Populates the available sources, if pending, when shown while enabled.
+        """
+        if self._availableSourcesPending and self.isEnabled():
+            self._populateAvailableSources()
+        super(_SourceEntryWidget, self).showEvent(event)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Populates the available sources, if pending, when enabled while visible.
+        """
+        if event.type() == QEvent.EnabledChange and self._availableSourcesPending and self.isEnabled() \
+                and self.isVisible():
+            self._populateAvailableSources()
+        super(_SourceEntryWidget, self).changeEvent(event)
 
+    def _populateAvailableSources(self):
+        """Populates the available sources from the current context.
+        """
+        self._availableSourcesPending = False
+        context = self.context[-1]
+        if isinstance(context, _erm.Table):
+            self._updateAvailableSourcesFromTable(context)
+        self.pushButton.setEnabled(self.availableSource.count() > 0)  # disable if no sources
+
+    def _setAvailableSourcesModel(self, model: QStandardItemModel, save: bool = False):
+        """Installs the model of available sources.
+
+        :param model: the new model of available sources
+        :param save: save the current model on the stack, to be restored by `on_pop`; otherwise it is discarded
+        """
+        current = self.availableSource.model()
+        self.availableSource.setModel(model)
+        self.availableSource.setCurrentIndex(-1)  # show placeholder
+        if save:
+            self._modelStack.append(current)
+        elif current.parent() is self:  # note: the combobox deletes its own initial model
+            current.deleteLater()
+
+    def _updateAvailableSourcesFromTable(self, table, save: bool = False):
+        """Updates the list of available sources based on the given table.
+
+        :param table: the table whose columns and foreign keys are the available sources
+        :param save: save the current model on the stack, to be restored by `on_pop`
+        """
         assert isinstance(table, _erm.Table)
-        self.availableSource.clear()
-        for column in table.columns:
-            self.availableSource.addItem(
-                column.name,
-                userData=column
-            )
-        for fkey in table.foreign_keys:
-            self.availableSource.addItem(
-                "%s:%s (outbound)" % tuple(constraint_name(fkey)),
-                userData={__outbound__: fkey}
-            )
-        for ref in table.referenced_by:
-            self.availableSource.addItem(
-                "%s:%s (inbound)" % tuple(constraint_name(ref)),
-                userData={__inbound__: ref}
+
+        # ...get the (text, data) pairs of the available sources, formatted from the table once per widget
+        sources = self._availableSources.get(table)
+        if sources is None:
+            sources = self._availableSources[table] = [(column.name, column) for column in table.columns] + sorted(
+                [("%s:%s (outbound)" % tuple(constraint_name(fkey)), {__outbound__: fkey}) for fkey in table.foreign_keys],
+                key=lambda pair: pair[0]
+            ) + sorted(
+                [("%s:%s (inbound)" % tuple(constraint_name(ref)), {__inbound__: ref}) for ref in table.referenced_by],
+                key=lambda pair: pair[0]
             )
 
+        # ...populate a new model off-widget with a single insert, then install it in one step
+        items = []
+        for text, data in sources:
+            item = QStandardItem(text)
+            item.setData(data, Qt.UserRole)
+            items.append(item)
+        model = QStandardItemModel(self)
+        model.invisibleRootItem().appendRows(items)
+
+        self._setAvailableSourcesModel(model, save=save)
+
     @pyqtSlot()
     def on_push(self):
         """Handler for pushing a path element onto the 'source' property.
         """
-        data = self.availableSource.currentData()
+        data = self.availableSource.currentData(Qt.UserRole)
         if not data:
             return
 
         # update the source list display
-        self.sourceList.addItem(
-            self.availableSource.currentText()
-        )
+        self._sourceModel.insertRow(self._depth)
+        self._sourceModel.setData(self._sourceModel.index(self._depth), self.availableSource.currentText())
 
         # update the available sources, source entry, and append to the context
+        source = self.entry[__source__]
         if isinstance(data, _erm.Column):
             context = data
-            self.availableSource.clear()
+            self._setAvailableSourcesModel(QStandardItemModel(self), save=True)
             self.availableSource.setEnabled(False)
             self.pushButton.setEnabled(False)
-            self.entry[__source__].append(data.name)
+            source.append(data.name)
         elif __outbound__ in data:
             fkey = data[__outbound__]
             assert isinstance(fkey, _erm.ForeignKey)
             context = fkey.pk_table
-            self._updateAvailableSourcesFromTable(context)
-            self.entry[__source__].append({
+            self._updateAvailableSourcesFromTable(context, save=True)
+            source.append({
                 __outbound__: constraint_name(fkey)
             })
         else:
             fkey = data[__inbound__]
             assert isinstance(fkey, _erm.ForeignKey)
             context = fkey.table
-            self._updateAvailableSourcesFromTable(context)
-            self.entry[__source__].append({
+            self._updateAvailableSourcesFromTable(context, save=True)
+            source.append({
                 __inbound__: constraint_name(fkey)
             })
 
         # update control state
         self.context.append(context)
+        self._depth += 1
         self.popButton.setEnabled(True)
 
         # emit changes
@@ -504,19 +605,22 @@ class _SourceEntryWidget(QWidget):
         """Handler for popping the top path element of the 'source' property.
         """
 
-        # update source list
-        self.sourceList.takeItem(len(self.sourceList)-1)
-
-        # update entry source
-        if self.entry[__source__]:
+        # update source list and entry source
+        if self._depth:
+            self._depth -= 1
+            self._sourceModel.removeRow(self._depth)
             self.entry[__source__].pop()
             self.context.pop()
-            self._updateAvailableSourcesFromTable(self.context[-1])
+            if self._modelStack:
+                self._setAvailableSourcesModel(self._modelStack.pop())
+            else:
+                # ...path element was loaded from the existing entry, so there is no saved model to restore
+                self._updateAvailableSourcesFromTable(self.context[-1])
 
         # update control state
         self.availableSource.setEnabled(True)
         self.pushButton.setEnabled(True)
-        self.popButton.setEnabled(len(self.entry[__source__]) > 0)
+        self.popButton.setEnabled(self._depth > 0)
 
         # emit changes
         self.valueChanged.emit()
@@ -1,10 +1,19 @@
 """Common components for managing various forms of sort keys in annotations.
 """
 from PyQt5.QtWidgets import QWidget, QHBoxLayout
+from PyQt5.QtCore import pyqtSlot
 from .common import SimpleComboBoxPropertyWidget, SimpleBooleanPropertyWidget
 from .table import CommonTableWidget
 
 
+def _sortkey_to_row(sortkey) -> tuple:
+    """Returns the (column, descending) row for a sortkey given as either a column name or a sortkey object.
+    """
+    if isinstance(sortkey, str):
+        return sortkey, False
+    return sortkey['column'], sortkey.get('descending', False)
+
+
 class SortKeysWidget(CommonTableWidget):
 
     def __init__(self, key: str, body: dict, columns: list, parent: QWidget = None):
@@ -20,12 +29,17 @@ class SortKeysWidget(CommonTableWidget):
             body,
             editor_widget=_SortKeyWidget(columns),
             headers_fn=lambda sortkeys: ['Column', 'Descending'],
-            row_fn=lambda sortkey: (
-                sortkey if isinstance(sortkey, str) else sortkey['column'],
-                sortkey.get('descending', False) if isinstance(sortkey, dict) else False
-            ),
+            row_fn=_sortkey_to_row,
             parent=parent)
 
+    @pyqtSlot()
+    def on_add_click(self):
+        """Handler for adding a sortkey, ignored until a column is selected.
+        """
+        if not self.editor_widget.value.get('column'):
+            return
+        super(SortKeysWidget, self).on_add_click()
+
 
 class _SortKeyWidget(QWidget):
     """Inline editor widget for sortkey properties.
@@ -1,14 +1,13 @@
 """Components for `source-definitions` annotation.
 """
-from copy import deepcopy
 import logging
 from PyQt5.QtWidgets import QLabel, QVBoxLayout, QFrame, QWidget, QTableView, QGroupBox, \
     QPushButton, QHBoxLayout, QDialog, QDialogButtonBox, QMessageBox
-from PyQt5.QtCore import QAbstractTableModel, QVariant, Qt, pyqtSlot, pyqtSignal
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSlot, pyqtSignal
 from deriva.core import tag as _tag, ermrest_model as _erm
 from .pseudo_column import PseudoColumnEditWidget
 from .common import source_path_to_str, constraint_name, SomeOrAllSelectorWidget, SimpleComboBoxPropertyWidget, \
-    SimpleTextPropertyWidget, SimpleNestedPropertyManager, raise_on_invalid
+    SimpleTextPropertyWidget, SimpleNestedPropertyManager, raise_on_invalid, copy_json
 from .table import CommonTableWidget
 
 logger = logging.getLogger(__name__)
@@ -17,6 +16,12 @@ __sources__ = 'sources'
 __search_box_key__ = 'search-box'
 
 
+def _fkey_to_str(name: list) -> str:
+    """Display string of a fkey constraint name.
+    """
+    return '%s:%s' % (name[0], name[1])
+
+
 class SourceDefinitionsEditor(QWidget):
     """Editor for the `source-definitions` annotation.
     """
@@ -51,7 +56,7 @@ class SourceDefinitionsEditor(QWidget):
         columnsGroup.setLayout(QVBoxLayout(columnsGroup))
         columnsGroup.layout().setContentsMargins(0, 0, 0 , 0)
         self.someOrAllColumns = SomeOrAllSelectorWidget(self.body.get('columns', True),
-                                                        [c.name for c in self.table.columns],
+                                                        self.column_names,
                                                         parent=self)
         self.someOrAllColumns.valueChanged.connect(self._on_columns_changed)
         columnsGroup.layout().addWidget(self.someOrAllColumns)
@@ -63,7 +68,7 @@ class SourceDefinitionsEditor(QWidget):
         fkeysGroup.layout().setContentsMargins(0, 0, 0 , 0)
         self.someOrAllFKeys = SomeOrAllSelectorWidget(self.body.get('fkeys', True),
                                                       [constraint_name(c) for c in self.table.foreign_keys],
-                                                      lambda c: '%s:%s' % (c[0], c[1]),
+                                                      _fkey_to_str,
                                                       parent=self)
         self.someOrAllFKeys.valueChanged.connect(self._on_fkeys_changed)
         fkeysGroup.layout().addWidget(self.someOrAllFKeys)
@@ -73,7 +78,7 @@ class SourceDefinitionsEditor(QWidget):
         sourcesGroup = QGroupBox('Sources: configure source definitions for use in other annotations', parent=self)
         sourcesGroup.setLayout(QVBoxLayout(sourcesGroup))
         sourcesGroup.layout().setContentsMargins(0, 0, 0 , 0)
-        sourcesWidget = _SourcesWidget(self.table, self._sources_manager.value, parent=self)
+        sourcesWidget = _SourcesWidget(self.table, self._sources_manager.value, column_names=self.column_names, parent=self)
         sourcesWidget.valueChanged.connect(self._sources_manager.onValueChanged)
         sourcesGroup.layout().addWidget(sourcesWidget)
         layout.addWidget(sourcesGroup)
@@ -98,13 +103,18 @@ class SourceDefinitionsEditor(QWidget):
     def _on_columns_changed(self):
         """Handles changes to the 'columns' property.
         """
-        self.body['columns'] = self.someOrAllColumns.selected_values
+        # ...the selected subset is updated in place, so the property only needs to be set when its object changes
+        value = self.someOrAllColumns.selected_values
+        if self.body.get('columns') is not value:
+            self.body['columns'] = value
 
     @pyqtSlot()
     def _on_fkeys_changed(self):
         """Handles changes to the 'fkeys' property.
         """
-        self.body['fkeys'] = self.someOrAllFKeys.selected_values
+        value = self.someOrAllFKeys.selected_values
+        if self.body.get('fkeys') is not value:
+            self.body['fkeys'] = value
 
 
 class _SourcesWidget(QWidget):
@@ -118,13 +128,14 @@ class _SourcesWidget(QWidget):
         def __init__(self, sources):
             super(_SourcesWidget.TableModel, self).__init__()
             self.headers = ["Source Key", "Source"]
-            self.rows = [
-                (
-                    key,
-                    source_path_to_str(sources[key].get('source', sources[key].get('sourcekey', 'virtual')))
-                )
-                for key in sources if key not in {__search_box_key__}
-            ]
+            self.rows = [self._row(key, source) for key, source in sources.items() if key != __search_box_key__]
+
+        @staticmethod
+        def _row(key: str, source: dict) -> tuple:
+            """Returns the (sourcekey, source path) row of a source definition.
+            """
+            path = source['source'] if 'source' in source else source.get('sourcekey', 'virtual')
+            return key, source_path_to_str(path)
 
         def rowCount(self, parent):
             return len(self.rows)
@@ -133,25 +144,49 @@ class _SourcesWidget(QWidget):
             return len(self.headers)
 
         def data(self, index, role):
+            # ...`None` is converted to an invalid QVariant, without constructing one per cell
             if role != Qt.DisplayRole:
-                return QVariant()
+                return None
             return self.rows[index.row()][index.column()]
 
         def headerData(self, section, orientation, role):
             if role != Qt.DisplayRole or orientation != Qt.Horizontal:
-                return QVariant()
+                return None
             return self.headers[section]
 
+        def appendSource(self, key: str, source: dict):
+            """Appends the row for a source definition added to the end of the sources.
+            """
+            row = len(self.rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.rows.append(self._row(key, source))
+            self.endInsertRows()
+
+        def removeSource(self, row: int):
+            """Removes the row of a source definition removed from the sources.
+            """
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.rows[row]
+            self.endRemoveRows()
+
     table: _erm.Table
     valueChanged = pyqtSignal()
 
-    def __init__(self, table: _erm.Table, sources: dict, parent: QWidget = None):
+    def __init__(self, table: _erm.Table, sources: dict, column_names: iter = None, parent: QWidget = None):
         """Initialize the _SourcesWidget.
+
+        :param table: the ermrest table of the source definitions
+        :param sources: the source definitions
+        :param column_names: the column names of the table, if already known to the caller
+        :param parent: the parent widget
         """
         super(_SourcesWidget, self).__init__(parent=parent)
         self.table = table
         self.sources = sources
-        self.column_names = set([c.name for c in self.table.columns])
+        self.column_names = frozenset(
+            column_names if column_names is not None else (c.name for c in self.table.columns)
+        )
+        self._reserved_keys = self.column_names | {__search_box_key__}  # keys reserved in addition to the sourcekeys
 
         # table view
         self.model = model = _SourcesWidget.TableModel(self.sources)
@@ -201,14 +236,12 @@ class _SourcesWidget(QWidget):
         """
         dialog = _SourceDefinitionDialog(
             self.table,
-            reserved_keys=self.column_names | {__search_box_key__} | self.sources.keys(),
+            reserved_keys=self._reserved_keys | self.sources.keys(),
             parent=self)
         code = dialog.exec_()
         if code == QDialog.Accepted:
             self.sources[dialog.sourcekey] = dialog.entry
-            self.tableView.setModel(
-                _SourcesWidget.TableModel(self.sources)
-            )
+            self.model.appendSource(dialog.sourcekey, dialog.entry)
             self.valueChanged.emit()
 
     @pyqtSlot()
@@ -217,16 +250,17 @@ class _SourcesWidget(QWidget):
         """
         index = self.tableView.currentIndex().row()
         if index >= 0:
-            sourcekey = orig = self.tableView.model().rows[index][0]
-            duplicate = deepcopy(self.sources[sourcekey])
+            orig = self.model.rows[index][0]
+            duplicate = copy_json(self.sources[orig])
+            # ...use the first free '<orig>_copy_<n>' key, collecting the taken suffixes in one pass
+            prefix = orig + '_copy_'
+            taken = {key[len(prefix):] for key in self.sources if key.startswith(prefix)}
             disambig = 1
-            while sourcekey in self.sources:
-                sourcekey = orig + '_copy_' + str(disambig)
+            while str(disambig) in taken:
                 disambig += 1
+            sourcekey = prefix + str(disambig)
             self.sources[sourcekey] = duplicate
-            self.tableView.setModel(
-                _SourcesWidget.TableModel(self.sources)
-            )
+            self.model.appendSource(sourcekey, duplicate)
             self.valueChanged.emit()
 
     @pyqtSlot()
@@ -235,12 +269,10 @@ class _SourcesWidget(QWidget):
         """
         index = self.tableView.currentIndex().row()
         if index >= 0:
-            sourcekey = self.tableView.model().rows[index][0]
+            sourcekey = self.model.rows[index][0]
             del self.sources[sourcekey]
-            self.tableView.setModel(
-                _SourcesWidget.TableModel(self.sources)
-            )
-            index = index if index < len(self.sources) else index - 1
+            self.model.removeSource(index)
+            index = index if index < len(self.model.rows) else index - 1
             self.tableView.selectRow(index)
             self.valueChanged.emit()
 
@@ -249,19 +281,19 @@ class _SourcesWidget(QWidget):
         """Handler for double-click event which opens the source editor dialog.
         """
         index = self.tableView.currentIndex().row()
-        sourcekey = self.tableView.model().rows[index][0]
+        sourcekey = self.model.rows[index][0]
         dialog = _SourceDefinitionDialog(self.table,
                                          sourcekey=sourcekey,
-                                         entry=deepcopy(self.sources[sourcekey]),
-                                         reserved_keys=self.column_names | {__search_box_key__} | self.sources.keys() - {sourcekey},
+                                         entry=copy_json(self.sources[sourcekey]),
+                                         reserved_keys=self._reserved_keys | (self.sources.keys() - {sourcekey}),
                                          parent=self)
         code = dialog.exec_()
         if code == QDialog.Accepted:
+            # ...the edited definition is re-added, which moves it to the end of the sources
             del self.sources[sourcekey]
             self.sources[dialog.sourcekey] = dialog.entry
-            self.tableView.setModel(
-                _SourcesWidget.TableModel(self.sources)
-            )
+            self.model.removeSource(index)
+            self.model.appendSource(dialog.sourcekey, dialog.entry)
             self.valueChanged.emit()
 
     @pyqtSlot()
@@ -277,14 +309,14 @@ class _SourceDefinitionDialog(QDialog):
 
     table: _erm.Table
     entry: dict
-    reserved_keys = [str]
+    reserved_keys: frozenset
 
     def __init__(self, table: _erm.Table, sourcekey: str = '', entry: dict = None, reserved_keys: set or iter = None, parent: QWidget = None):
         super(_SourceDefinitionDialog, self).__init__(parent=parent)
         self.table = table
         self.sourcekey = sourcekey
         self.entry = entry or {}
-        self.reserved_keys = reserved_keys or []
+        self.reserved_keys = frozenset(reserved_keys or ())
 
         self.setWindowTitle("Source Definition")
         self.setMinimumWidth(640)
@@ -322,7 +354,7 @@ class _SourceDefinitionDialog(QDialog):
                 self,
                 'Validation Error',
                 'Source Key must be unique. Current keys defined: %s.' % (
-                    ', '.join(map(lambda s: '"%s"' % s, self.reserved_keys))
+                    ', '.join('"%s"' % key for key in sorted(self.reserved_keys))
                 ),
                 QMessageBox.Ok
             )
@@ -1,10 +1,11 @@
 """Base widget for tabbed contexts editors, intended for internal use only.
 """
+from bisect import bisect
 import logging
 from typing import Callable
 from PyQt5.QtWidgets import QWidget, QTabWidget, QFormLayout, QLabel, QComboBox, QPushButton, QVBoxLayout, QLineEdit, \
     QMessageBox
-from PyQt5.QtCore import pyqtSlot, pyqtSignal
+from PyQt5.QtCore import QSignalBlocker, pyqtSlot, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,7 @@ class TabbedContextsWidget(QWidget):
         """
         super(TabbedContextsWidget, self).__init__(parent=parent)
         self._context_names: [str] = []
+        self._context_index: {str: int} = {}  # context name -> index of its (first) tab
         self._available_contexts: {str} = set(available_contexts)
 
         # layout
@@ -90,12 +92,13 @@ class TabbedContextsWidget(QWidget):
         if allow_context_reference:
             form.addRow(self.tr('Reference Existing'), self._referenceExistingComboBox)
 
-        self._resetComboBoxes()
-
         # ...create button
         self._createButton = QPushButton('Add')
         self._createButton.setEnabled(False)
+        self._create_enabled = False  # last enabled state set on the create button
         self._createButton.clicked.connect(self._on_contextName_createEvent)
+
+        self._resetComboBoxes()
         form.addWidget(self._createButton)
         addContextTab.setAutoFillBackground(True)
         self._tabs.addTab(addContextTab, '<add>')
@@ -104,10 +107,12 @@ class TabbedContextsWidget(QWidget):
     def _on_contextName_textChanged(self):
         """Handles index changes to contextName combo box.
         """
-        if self._contextNameComboBox.currentText():
-            self._createButton.setEnabled(True)
-        else:
-            self._createButton.setEnabled(False)
+        context = self._contextNameComboBox.currentText()
+        enabled = bool(context) and context not in self._context_index
+        # ...called on every keystroke, so only touch the button when its state flips
+        if enabled != self._create_enabled:
+            self._createButton.setEnabled(enabled)
+            self._create_enabled = enabled
 
     @pyqtSlot()
     def _on_contextName_createEvent(self):
@@ -146,11 +151,11 @@ class TabbedContextsWidget(QWidget):
     def setActiveContext(self, context_name: str) -> None:
         """Sets the active context tab.
         """
-        try:
-            index = self._context_names.index(context_name)
-            self._tabs.setCurrentIndex(index)
-        except ValueError:
+        index = self._context_index.get(context_name)
+        if index is None:
             logger.error('Context "%s" not found' % context_name)
+            return
+        self._tabs.setCurrentIndex(index)
 
     def setActiveContextByIndex(self, index: int) -> None:
         """Sets the active context tab by simple numeric index.
@@ -163,35 +168,72 @@ class TabbedContextsWidget(QWidget):
         :param context_widget: widget for the context
         :param context_name: text name of the context
         """
-        if context_name in self._context_names:
+        self._insertContext(context_widget, context_name)
+        self._resetContextNameComboBox()
+        # ...insert the new name in order, rather than repopulating the sorted reference choices
+        references = [self._referenceExistingComboBox.itemText(i) for i in range(self._referenceExistingComboBox.count())]
+        self._referenceExistingComboBox.insertItem(bisect(references, context_name), context_name)
+
+    def addContexts(self, contexts: iter) -> None:
+        """Adds several context widgets and labels at once.
+
+        Same as calling `addContext` for each, except that the tabs are inserted with updates and signals suspended
+        and the combo boxes are reset only once.
+
+        :param contexts: iterable of (context widget, context name) pairs
+        """
+        self.setUpdatesEnabled(False)
+        with QSignalBlocker(self._tabs):
+            for context_widget, context_name in contexts:
+                self._insertContext(context_widget, context_name)
+        self._resetComboBoxes()
+        self.setUpdatesEnabled(True)
+
+    def _insertContext(self, context_widget: QWidget, context_name: str) -> None:
+        """Inserts the context tab and records its name, without updating the combo boxes.
+        """
+        if context_name in self._context_index:
             logger.warning('"%s" already exists in tabbed contexts' % context_name)
+        self._context_index.setdefault(context_name, len(self._context_names))
         self._context_names.append(context_name)
         self._available_contexts -= {context_name}
-        self._resetComboBoxes()
         self._tabs.insertTab(self._tabs.count()-1, context_widget, context_name)
 
     def removeContext(self, context_name: str) -> None:
         """Removes the context.
         """
-        assert context_name in self._context_names, 'Unexpected context_name'
-        try:
-            index = self._context_names.index(context_name)
-            del self._context_names[index]
-            self._available_contexts |= {context_name}
-            self._resetComboBoxes()
-            self._tabs.removeTab(index)
-        except ValueError:
+        assert context_name in self._context_index, 'Unexpected context_name'
+        index = self._context_index.get(context_name)
+        if index is None:
             logger.error('Context "%s" not found' % context_name)
+            return
+        del self._context_names[index]
+        # ...reindex, since the following tabs shift down
+        self._context_index.clear()
+        for i, name in enumerate(self._context_names):
+            self._context_index.setdefault(name, i)
+        self._available_contexts |= {context_name}
+        self._resetContextNameComboBox()
+        self._referenceExistingComboBox.removeItem(self._referenceExistingComboBox.findText(context_name))
+        self._tabs.removeTab(index)
 
     def _resetComboBoxes(self):
         """Resets the state of the ComboBoxes.
         """
-        self._contextNameComboBox.clear()
-        self._contextNameComboBox.addItems(self._available_contexts)
-        self._contextNameComboBox.model().sort(0)
         self._referenceExistingComboBox.clear()
         self._referenceExistingComboBox.addItems(self._context_names)
         self._referenceExistingComboBox.model().sort(0)
+        self._resetContextNameComboBox()
+
+    def _resetContextNameComboBox(self):
+        """Resets the state of the context name ComboBox.
+        """
+        # ...block the signals emitted while repopulating, then update the dependent control state once
+        with QSignalBlocker(self._contextNameComboBox):
+            self._contextNameComboBox.clear()
+            self._contextNameComboBox.addItems(self._available_contexts)
+            self._contextNameComboBox.model().sort(0)
+        self._on_contextName_textChanged()
 
 
 class EasyTabbedContextsWidget(TabbedContextsWidget):
@@ -237,16 +279,30 @@ class EasyTabbedContextsWidget(TabbedContextsWidget):
         self.removeContextRequested.connect(self._on_removeContextRequested)
 
         # create widgets for contexts
-        for context, value in self.body.get(key, {}).items():
-            self.addContext(
-                self._referenceWidget(value) if allow_context_reference and isinstance(value, str) else self.create_context_widget_fn(context, parent=self),
+        # ...context editors are created on first activation, since only one of them is visible at a time
+        self._lazy_contexts = {}  # context name -> placeholder widget for its editor
+        self.addContexts(
+            (
+                self._referenceWidget(value) if allow_context_reference and isinstance(value, str) else self._placeholderWidget(context),
                 context
             )
+            for context, value in self.body.get(key, {}).items()
+        )
+        self._tabs.currentChanged.connect(self._on_currentChanged)
 
         # set first context active
         if self._tabs.count():
             self.setActiveContextByIndex(0)
 
+    def _placeholderWidget(self, context_name):
+        """Returns an empty widget to hold the editor of a context until it is first activated.
+        """
+        widget = QWidget(parent=self)
+        widget.setLayout(QVBoxLayout(widget))
+        widget.layout().setContentsMargins(0, 0, 0, 0)
+        self._lazy_contexts[context_name] = widget
+        return widget
+
     def _referenceWidget(self, context_name):
         """Returns the widget to represent a context that references another context.
         """
@@ -255,6 +311,15 @@ class EasyTabbedContextsWidget(TabbedContextsWidget):
         widget.layout().addWidget(QLabel(self.tr('This context references: ') + context_name, parent=self))
         return widget
 
+    @pyqtSlot(int)
+    def _on_currentChanged(self, index: int):
+        """Handles tab changes by creating the editors of lazily constructed contexts.
+        """
+        if index < len(self._context_names):
+            placeholder = self._lazy_contexts.pop(self._context_names[index], None)
+            if placeholder:
+                placeholder.layout().addWidget(self.create_context_widget_fn(self._context_names[index], parent=placeholder))
+
     @pyqtSlot(str, str)
     def _on_createContextRequested(self, context, reference):
         """Handles the 'createContextRequested' signal.
@@ -274,5 +339,6 @@ class EasyTabbedContextsWidget(TabbedContextsWidget):
         del self.body[self.key][context]
         if self.purge_on_empty and not self.body[self.key]:
             del self.body[self.key]
+        self._lazy_contexts.pop(context, None)
         self.removeContext(context)
         self.valueChanged.emit()
\ No newline at end of file
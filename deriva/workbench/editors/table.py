@@ -1,11 +1,10 @@
 """Components for shared table widgets.
 """
 from collections.abc import Callable
-from copy import deepcopy
 import logging
 from PyQt5.QtWidgets import QVBoxLayout, QFrame, QWidget, QTableView, QPushButton, QHBoxLayout, QDialog, QHeaderView
-from PyQt5.QtCore import QAbstractTableModel, QVariant, Qt, pyqtSlot, pyqtSignal
-from .common import set_value_or_del_key
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSlot, pyqtSignal
+from .common import set_value_or_del_key, copy_json
 
 logger = logging.getLogger(__name__)
 
@@ -31,22 +30,39 @@ class CommonTableWidget(QWidget):
             :param row_fn: a function to return one row tuple for a single given element of the data
             """
             super(CommonTableWidget._InternalTableModel, self).__init__()
+            self.headers_fn, self.row_fn = headers_fn, row_fn
+            # ...headers from the `headers_fn` are fixed, so get them once rather than on every reset
+            if self.headers_fn:
+                self.headers = self.headers_fn(data)
+            self._initData(data)
 
-            # header
-            if headers_fn:
-                self.headers = headers_fn(data)
-            elif data and isinstance(data[0], dict):
-                self.headers = list(data[0].keys())
-            else:
-                self.headers = ['Value']
+        def _initData(self, data: list):
+            """Initializes the headers and rows from the data.
+
+            Rows are computed from their elements on first display, as the view only asks for the visible ones.
+            """
+            self._data = data
+            # header, unless fixed by the `headers_fn`
+            if not self.headers_fn:
+                self.headers = list(data[0].keys()) if data and isinstance(data[0], dict) else ['Value']
 
             # row values
-            if row_fn:
-                self.rows = [row_fn(entry) for entry in data]
+            if self.row_fn:
+                self._entry_to_row = self.row_fn
             elif data and isinstance(data[0], dict):
-                self.rows = [tuple(entry.values()) for entry in data]
+                self._entry_to_row = lambda entry: tuple(entry.values())
             else:
-                self.rows = [(str(entry),) for entry in data]
+                self._entry_to_row = lambda entry: (str(entry),)
+            self.rows = [None] * len(data)
+
+        def resetData(self, data: list):
+            """Resets the model to the (changed) data.
+
+            :param data: the list of data managed by the component
+            """
+            self.beginResetModel()
+            self._initData(data)
+            self.endResetModel()
 
         def rowCount(self, parent):
             return len(self.rows)
@@ -55,15 +71,56 @@ class CommonTableWidget(QWidget):
             return len(self.headers)
 
         def data(self, index, role):
+            # ...`None` is converted to an invalid QVariant, without constructing one per cell
             if role != Qt.DisplayRole:
-                return QVariant()
-            return self.rows[index.row()][index.column()]
+                return None
+            row = self.rows[index.row()]
+            if row is None:
+                row = self.rows[index.row()] = self._entry_to_row(self._data[index.row()])
+            return row[index.column()]
 
         def headerData(self, section, orientation, role):
             if role != Qt.DisplayRole or orientation != Qt.Horizontal:
-                return QVariant()
+                return None
             return self.headers[section]
 
+        def appendEntry(self):
+            """Appends the row for a single new element appended to the data.
+            """
+            row = len(self.rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.rows.append(None)
+            self.endInsertRows()
+
+        def removeEntry(self, row: int):
+            """Removes the row of a single element removed from the data.
+
+            :param row: the index of the element removed from the data
+            """
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.rows[row]
+            self.endRemoveRows()
+
+        def moveEntry(self, row: int, to: int):
+            """Moves the row of a single element moved within the data.
+
+            :param row: the former index of the element
+            :param to: the new index of the element
+            """
+            # ...qt expects the destination as the index the row is inserted before, prior to its removal
+            if not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), to + 1 if to > row else to):
+                return
+            self.rows.insert(to, self.rows.pop(row))
+            self.endMoveRows()
+
+        def replaceEntry(self, row: int):
+            """Replaces the row of a single element replaced in the data.
+
+            :param row: the index of the element
+            """
+            self.rows[row] = None
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1))
+
     def __init__(
             self,
             key: str,
@@ -97,7 +154,8 @@ class CommonTableWidget(QWidget):
         :param body: annotation body where `body[key]` must be a list of values to be managed by the widget
         :param editor_widget: the widget to be used for entering new values into the list
         :param editor_dialog_exec_fn: a function to return a dialog for adding to or editing values of the list
-        :param headers_fn: a function that takes the property as input and returns a list of text for the table header
+        :param headers_fn: a function that takes the property as input and returns a list of text for the table header;
+            it is called once, so the headers must not depend on later changes to the property
         :param row_fn: a function that takes an item from the property and returns a flattened tuple for the row value
         :param resize_mode: the resize mode applied to the table view
         :param allow_copy: allow copying (duplication) of table items
@@ -111,6 +169,8 @@ class CommonTableWidget(QWidget):
         self.resize_mode = resize_mode
         self.editor_widget, self.editor_dialog_exec_fn = editor_widget, editor_dialog_exec_fn
         self._truth_fn = truth_fn
+        # ...otherwise, the table structure is derived from the first element of the data
+        self._incremental = bool(headers_fn and row_fn)
         # ...defensively, get property value
         self.value = body.get(key)
         if not isinstance(self.value, list):
@@ -165,12 +225,54 @@ class CommonTableWidget(QWidget):
         self.setLayout(layout)
         self.setAutoFillBackground(True)
 
+    def _commitValue(self):
+        """Sets the list property in the body, or drops it if the value fails the truth function.
+        """
+        set_value_or_del_key(self.body, self._truth_fn(self.value), self.key, self.value)
+
     def _refreshTableModel(self):
         """Refreshes the table view model.
         """
-        self.tableView.setModel(
-            self._InternalTableModel(self.value, headers_fn=self.headers_fn, row_fn=self.row_fn)
-        )
+        self.tableView.model().resetData(self.value)
+
+    def _isIncremental(self, *rows: int) -> bool:
+        """Tests whether the table view model may be updated in place for changes to the given rows.
+
+        A table structure derived from the data only holds while its first element is left untouched.
+        """
+        return self._incremental or min(rows) > 0
+
+    def _appendToTableModel(self):
+        """Updates the table view model for a value appended to the list.
+        """
+        if self._isIncremental(len(self.value) - 1):
+            self.tableView.model().appendEntry()
+        else:
+            self._refreshTableModel()
+
+    def _removeFromTableModel(self, index: int):
+        """Updates the table view model for a value removed from the list.
+        """
+        if self._isIncremental(index):
+            self.tableView.model().removeEntry(index)
+        else:
+            self._refreshTableModel()
+
+    def _moveInTableModel(self, index: int, to: int):
+        """Updates the table view model for a value moved within the list.
+        """
+        if self._isIncremental(index, to):
+            self.tableView.model().moveEntry(index, to)
+        else:
+            self._refreshTableModel()
+
+    def _replaceInTableModel(self, index: int):
+        """Updates the table view model for a value replaced in the list.
+        """
+        if self._isIncremental(index):
+            self.tableView.model().replaceEntry(index)
+        else:
+            self._refreshTableModel()
 
     @pyqtSlot()
     def on_add_click(self):
@@ -178,7 +280,7 @@ class CommonTableWidget(QWidget):
         """
         if self.editor_widget:
             # ...if editor_widget, then take value
-            value = deepcopy(self.editor_widget.value)
+            value = copy_json(self.editor_widget.value)
         else:
             # ...else display dialog and take value if accepted
             code, value = self.editor_dialog_exec_fn(None, parent=self)
@@ -187,15 +289,10 @@ class CommonTableWidget(QWidget):
 
         # add value and set
         self.value.append(value)
-        set_value_or_del_key(
-            self.body,
-            self._truth_fn(self.value),
-            self.key,
-            self.value
-        )
-
-        # refresh view model and emit state change
-        self._refreshTableModel()
+        self._commitValue()
+
+        # update view model and emit state change
+        self._appendToTableModel()
         self.valueChanged.emit()
 
     @pyqtSlot()
@@ -204,17 +301,12 @@ class CommonTableWidget(QWidget):
         """
         index = self.tableView.currentIndex().row()
         if index >= 0:
-            duplicate = deepcopy(self.value[index])
+            duplicate = copy_json(self.value[index])
             self.value.append(duplicate)
-            set_value_or_del_key(
-                self.body,
-                self._truth_fn(self.value),
-                self.key,
-                self.value
-            )
-
-            # refresh view model and emit state change
-            self._refreshTableModel()
+            self._commitValue()
+
+            # update view model and emit state change
+            self._appendToTableModel()
             self.valueChanged.emit()
 
     @pyqtSlot()
@@ -224,15 +316,10 @@ class CommonTableWidget(QWidget):
         index = self.tableView.currentIndex().row()
         if index >= 0:
             del self.value[index]
-            set_value_or_del_key(
-                self.body,
-                self._truth_fn(self.value),
-                self.key,
-                self.value
-            )
-
-            # refresh view model and emit state change
-            self._refreshTableModel()
+            self._commitValue()
+
+            # update view model and emit state change
+            self._removeFromTableModel(index)
             self.valueChanged.emit()
 
             # update current index
@@ -245,18 +332,11 @@ class CommonTableWidget(QWidget):
         """
         index = self.tableView.currentIndex().row()
         if index > 0:
-            temp = self.value[index]
-            del self.value[index]
-            self.value.insert(index-1, temp)
-            set_value_or_del_key(
-                self.body,
-                self._truth_fn(self.value),
-                self.key,
-                self.value
-            )
-
-            # refresh view model and emit state change
-            self._refreshTableModel()
+            self.value[index-1], self.value[index] = self.value[index], self.value[index-1]
+            self._commitValue()
+
+            # update view model and emit state change
+            self._moveInTableModel(index, index - 1)
             self.valueChanged.emit()
 
             # update current index
@@ -268,18 +348,11 @@ class CommonTableWidget(QWidget):
         """
         index = self.tableView.currentIndex().row()
         if -1 < index < len(self.value)-1:
-            temp = self.value[index]
-            del self.value[index]
-            self.value.insert(index+1, temp)
-            set_value_or_del_key(
-                self.body,
-                self._truth_fn(self.value),
-                self.key,
-                self.value
-            )
-
-            # refresh view model and emit state change
-            self._refreshTableModel()
+            self.value[index+1], self.value[index] = self.value[index], self.value[index+1]
+            self._commitValue()
+
+            # update view model and emit state change
+            self._moveInTableModel(index, index + 1)
             self.valueChanged.emit()
 
             # update current index
@@ -296,12 +369,7 @@ class CommonTableWidget(QWidget):
             if code == QDialog.Accepted:
                 # ...replace value and set
                 self.value[index] = value
-                set_value_or_del_key(
-                    self.body,
-                    self._truth_fn(self.value),
-                    self.key,
-                    self.value
-                )
-                # ...refresh view model and emit state change
-                self._refreshTableModel()
+                self._commitValue()
+                # ...update view model and emit state change
+                self._replaceInTableModel(index)
                 self.valueChanged.emit()
@@ -1,11 +1,10 @@
 """Widgets for editing visible-sources annotations.
 """
-from copy import deepcopy
 import logging
 from PyQt5.QtWidgets import QLabel, QVBoxLayout, QFrame, QWidget, QComboBox, QDialog, QButtonGroup, QRadioButton, QDialogButtonBox
 from PyQt5.QtCore import pyqtSlot
 from deriva.core import tag as _tag, ermrest_model as _erm
-from .common import constraint_name, source_path_to_str, raise_on_invalid
+from .common import constraint_name, source_path_to_str, raise_on_invalid, copy_json
 from .tabbed_contexts import EasyTabbedContextsWidget
 from .pseudo_column import PseudoColumnEditWidget
 from .table import CommonTableWidget
@@ -56,9 +55,10 @@ def _create_visible_source_context_editor(table: _erm.Table, tag: str, body: dic
 
     # dialog exec function
     def visible_source_dialog_exec_fn(value, parent: QWidget = None):
-        dialog = VisibleSourceDialog(table, entry=value, mode=mode, parent=parent)
+        # ...the dialog edits its entry in place, so hand it a copy that is simply dropped if not accepted
+        dialog = VisibleSourceDialog(table, entry=copy_json(value), mode=mode, parent=parent)
         code = dialog.exec_()
-        value = deepcopy(dialog.entry)
+        value = dialog.entry if code == QDialog.Accepted else None
         dialog.hide()
         del dialog
         return code, value
@@ -185,6 +185,12 @@ class WorkbenchWindow(QMainWindow):
         queryTask.status_update_signal.connect(self.onSessionResult)
         queryTask.query()
 
+    def _selectedModelObject(self):
+        """Returns the model object selected in the browser, once the input pending in the editor is committed to it.
+        """
+        self.ui.editor.flush()
+        return self.ui.browser.lastItemSelected
+
     def enableControls(self):
         """Conditionally, enable actions based on state of user session and schema browser.
         """
@@ -332,7 +338,7 @@ class WorkbenchWindow(QMainWindow):
             return
 
         # check if current selection has 'annotations' container
-        model_obj = self.ui.browser.lastItemSelected
+        model_obj = self._selectedModelObject()
         if not hasattr(model_obj, 'annotations'):
             self.updateStatus("Cannot validate annotations. Current selected object does not have 'annotations'.")
 
@@ -375,7 +381,7 @@ class WorkbenchWindow(QMainWindow):
         """Handles actionUpdate event.
         """
         # validate current selected model obj
-        model_object = self.ui.browser.lastItemSelected
+        model_object = self._selectedModelObject()
         if not hasattr(model_object, 'apply'):
             error = self.tr("Cannot apply annotations. Current selected object does not have 'apply' attribute.")
             QMessageBox.critical(
@@ -435,7 +441,7 @@ class WorkbenchWindow(QMainWindow):
             error = self.tr("No directory to dump and restore annotations. Go to options and edit this server configuration.")
 
         # get current selected model obj
-        model_object = self.ui.browser.lastItemSelected
+        model_object = self._selectedModelObject()
         if not hasattr(model_object, 'annotations'):
             error = self.tr("Cannot dump annotations. Current selected object does not have 'annotations' property.")
 
@@ -497,7 +503,7 @@ class WorkbenchWindow(QMainWindow):
             error = self.tr("No directory to dump and restore annotations. Go to options and edit this server configuration.")
 
         # get current selected model obj
-        model_object = self.ui.browser.lastItemSelected
+        model_object = self._selectedModelObject()
         if not hasattr(model_object, 'annotations'):
             error = self.tr("Cannot restore annotations. Current selected object does not have 'annotations' property.")
 